@@ -27,6 +27,7 @@ setup(
         "aisuite>=0.1.6",
         "anthropic>=0.40.0",
         "openai>=1.57.0",
+        "orjson>=3.10.0",
         "rich>=13.9.4",
         "typer>=0.15.1",
         "httpx>=0.28.1",
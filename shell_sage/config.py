@@ -1,8 +1,10 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-import json
+import orjson
 from typing import Optional
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Get the configuration directory with proper permissions"""
     # Use XDG_CONFIG_HOME if available, otherwise fallback to ~/.config
@@ -15,26 +17,30 @@ def get_config_dir() -> Path:
     config_dir.chmod(0o700)
     return config_dir
 
+@lru_cache(maxsize=1)
 def get_config_file() -> Path:
     """Get the path to the credentials file"""
     return get_config_dir() / 'credentials.json'
 
+@lru_cache(maxsize=1)
 def load_api_key() -> Optional[str]:
     """Load API key from config file
 
+    The result is cached for the lifetime of the process; `save_api_key`
+    invalidates the cache after a write.
+
     Returns:
         Optional[str]: The API key if found, None otherwise
     """
     config_file = get_config_file()
     try:
-        if config_file.exists():
-            with open(config_file) as f:
-                config = json.load(f)
-                return config.get('anthropic_api_key')
-    except (json.JSONDecodeError, OSError) as e:
+        config = orjson.loads(config_file.read_bytes())
+        return config.get('anthropic_api_key')
+    except FileNotFoundError:
+        return None
+    except (orjson.JSONDecodeError, OSError):
         # Log error but don't expose details to caller
         return None
-    return None
 
 def save_api_key(api_key: str) -> None:
     """Save API key to config file
@@ -49,22 +55,29 @@ def save_api_key(api_key: str) -> None:
     if not api_key or not api_key.strip():
         raise ValueError("API key cannot be empty")
 
+    api_key = api_key.strip()
+
+    # Skip the write entirely if the stored key already matches; the
+    # cached load makes this check free
+    if load_api_key() == api_key:
+        return
+
     config_file = get_config_file()
     config = {}
 
-    # Load existing config if present
-    if config_file.exists():
-        try:
-            with open(config_file) as f:
-                config = json.load(f)
-        except json.JSONDecodeError:
-            # If file is corrupted, start fresh
-            pass
+    # Load existing config if present, preserving any other keys
+    try:
+        config = orjson.loads(config_file.read_bytes())
+    except FileNotFoundError:
+        pass
+    except orjson.JSONDecodeError:
+        # If file is corrupted, start fresh
+        pass
 
     # Update config
-    config['anthropic_api_key'] = api_key.strip()
+    config['anthropic_api_key'] = api_key
 
     # Write config with secure permissions
-    with open(config_file, 'w') as f:
-        json.dump(config, f)
-    config_file.chmod(0o600)  # Read/write for owner only
\ No newline at end of file
+    config_file.write_bytes(orjson.dumps(config))
+    config_file.chmod(0o600)  # Read/write for owner only
+    load_api_key.cache_clear()
\ No newline at end of file
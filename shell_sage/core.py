@@ -1,22 +1,17 @@
+import functools
 import logging
 import os
-import subprocess
 import sys
-from functools import partial
-from typing import Optional
-from pydantic import BaseModel
+from typing import Iterator, Optional
+from dataclasses import dataclass
 
 import typer
-from rich.console import Console
-from rich.markdown import Markdown
 
-import aisuite as ai
-from .pane import get_history
-from .prompts import sp as sage_prompt, ssp as sassy_sage_prompt
-from .providers import AVAILABLE_PROVIDERS, MODEL_ALIASES
+from .providers import AVAILABLE_PROVIDERS, MODEL_ALIASES, PROVIDER_MODELS
 
 
-class ShellSageConfig(BaseModel):
+@dataclass(slots=True)
+class ShellSageConfig:
     """Configuration for ShellSage CLI"""
     code_theme: str = "monokai"
     code_lexer: str = "python"
@@ -48,7 +43,7 @@ class ShellSageConfig(BaseModel):
             )
 
         model_name = resolved_model.split(":")[-1]
-        if model_name not in AVAILABLE_PROVIDERS[provider]["models"]:
+        if model_name not in PROVIDER_MODELS[provider]:
             valid_models = ", ".join(AVAILABLE_PROVIDERS[provider]["models"])
             raise ValueError(
                 f"Unknown model {model_name} for provider {provider}\n"
@@ -58,26 +53,19 @@ class ShellSageConfig(BaseModel):
         # Update the model to its full form
         self.model = resolved_model
 
-def create_messages(query: str, system_prompt: str) -> list[dict[str, str]]:
-    """Create properly formatted messages for AI completion
+_LOG_INIT = False
 
-    Args:
-        query: The user's query with context
-        system_prompt: The system prompt template
+@functools.cache
+def _console():
+    """Shared Console instance; terminal detection only runs once"""
+    from rich.console import Console
+    return Console()
 
-    Returns:
-        List of message dictionaries in the format expected by the AI client
-
-    Raises:
-        ValueError: If query or system_prompt is empty
-    """
-    if not query or not system_prompt:
-        raise ValueError("Query and system prompt cannot be empty")
-
-    return [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": query}
-    ]
+@functools.cache
+def _client():
+    """Shared aisuite client so batch callers reuse one connection pool"""
+    import aisuite as ai
+    return ai.Client()
 
 class ShellSage:
     def __init__(self, config: ShellSageConfig):
@@ -89,56 +77,91 @@ class ShellSage:
             ValueError: If invalid model specified
         """
         self.config = config
-        self.console = Console()
+        self.console = _console()
         self.setup_logging()
         self.setup_client()
 
     def setup_logging(self) -> None:
-        """Configure logging with specified level"""
+        """Configure logging with specified level (once per process)"""
+        global _LOG_INIT
+        self.logger = logging.getLogger(__name__)
+        if _LOG_INIT:
+            return
         logging.basicConfig(
             level=getattr(logging, self.config.log_level),
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
-        self.logger = logging.getLogger(__name__)
+        _LOG_INIT = True
 
     def setup_client(self) -> None:
-        """Initialize Claude client with appropriate prompt templates
+        """Initialize the AI client
 
         Raises:
-            ImportError: If prompt templates are not found
-            ConnectionError: If Claude API connection fails
+            ConnectionError: If client initialization fails
         """
         try:
-            self.client = ai.Client(
-
-            )
-            try:
-                self.ss = partial(self._get_completion, system=sage_prompt)
-                self.sss = partial(self._get_completion, system=sassy_sage_prompt)
-            except NameError as e:
-                raise ImportError(f"Failed to load prompt templates: {e}")
+            self.client = _client()
         except Exception as e:
             raise ConnectionError(f"Failed to initialize Claude client: {e}")
 
     def _get_completion(self, query: str, system: str) -> str:
         """Get completion from Claude with proper message formatting"""
-        messages = create_messages(query, system)
         response = self.client.chat.completions.create(
             model=self.config.model or "anthropic:claude-3-5-sonnet-20240620",
-            messages=messages,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": query}
+            ],
             temperature=0.7
         )
         return response.choices[0].message.content
 
+    def _stream_completion(self, query: str, system: str) -> Iterator[str]:
+        """Stream completion chunks as they arrive from the model
+
+        aisuite 0.1.6 only passes a usable stream through for the openai
+        provider (its anthropic provider tries to normalize the Stream
+        object and crashes), so anthropic models stream via the anthropic
+        SDK directly and other providers fall back to one blocking
+        completion yielded whole.
+        """
+        model = self.config.model or "anthropic:claude-3-5-sonnet-20240620"
+        provider, _, model_name = model.partition(":")
+        if provider == "anthropic":
+            import anthropic
+            with anthropic.Anthropic().messages.stream(
+                model=model_name,
+                max_tokens=4096,
+                system=system,
+                messages=[{"role": "user", "content": query}],
+                temperature=0.7
+            ) as stream:
+                yield from stream.text_stream
+        elif provider == "openai":
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user", "content": query}
+                ],
+                temperature=0.7,
+                stream=True
+            )
+            for chunk in response:
+                if chunk.choices and (delta := chunk.choices[0].delta.content):
+                    yield delta
+        else:
+            yield self._get_completion(query, system)
+
     def get_tmux_context(self, pid: str, n: int) -> Optional[str]:
         """Get tmux context safely with proper error handling"""
-        try:
-            if not os.environ.get('TMUX'):
-                return None
-            return get_history(n, pid)
-        except subprocess.CalledProcessError as e:
-            self.logger.warning(f"Failed to get tmux history: {e}")
+        if not os.environ.get('TMUX'):
             return None
+        from .pane import get_history
+        history = get_history(n, pid)
+        if history is None:
+            self.logger.warning("Failed to get tmux history")
+        return history
 
 app = typer.Typer(help="ShellSage - Your CLI Teaching Assistant")
 
@@ -148,6 +171,7 @@ def main(
     pid: str = typer.Option("current", help="Tmux pane ID ('current', 'all', or specific ID)"),
     history_lines: int = typer.Option(200, "--lines", "-n", help="Number of history lines"),
     sassy: bool = typer.Option(False, "--sassy", "-s", help="Enable sassy mode"),
+    stream: bool = typer.Option(True, "--stream/--no-stream", help="Stream the response as it arrives"),
     theme: str = typer.Option("monokai", help="Code theme for responses"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
     model: str = typer.Option(None, "--model", "-m", help="AI model to use (e.g., 'anthropic:claude-3-5-sonnet-20241022' or 'openai:gpt-4o')"),
@@ -162,28 +186,59 @@ def main(
         config.validate_model()  # Validate the model before proceeding
         sage = ShellSage(config)
 
-        # Build context
-        context_parts = []
+        # Build the query from flat fragments so large tmux histories are
+        # copied once by the final join instead of per f-string
+        parts = []
 
         # Get tmux context
         if tmux_context := sage.get_tmux_context(pid, history_lines):
-            context_parts.append(f"<terminal_history>\n{tmux_context}\n</terminal_history>")
+            parts.extend(("<terminal_history>\n", tmux_context, "\n</terminal_history>\n"))
 
         # Get stdin if available
         if not sys.stdin.isatty():
-            context_parts.append(f"<context>\n{sys.stdin.read()}</context>")
+            parts.extend(("<context>\n", sys.stdin.read(), "</context>\n"))
 
-        # Construct final query
-        full_query = "\n".join([*context_parts, f"<query>\n{query}\n</query>"])
+        parts.extend(("<query>\n", query, "\n</query>"))
+        full_query = "".join(parts)
 
         # Get and render response
-        response = sage.sss(full_query) if sassy else sage.ss(full_query)
-        sage.console.print(Markdown(
-            response,
+        if sassy:
+            from .prompts import ssp as prompt
+        else:
+            from .prompts import sp as prompt
+        if not sys.stdout.isatty():
+            # Piped output: skip the Markdown/Pygments pipeline entirely
+            print(sage._get_completion(full_query, prompt))
+            return
+        from rich.markdown import Markdown
+        md_options = dict(
             code_theme=config.code_theme,
             inline_code_lexer=config.code_lexer,
             inline_code_theme=config.code_theme
-        ))
+        )
+        if stream:
+            from rich.live import Live
+            chunks = []
+            with Live(Markdown("", **md_options), console=sage.console,
+                      refresh_per_second=15) as live:
+                for i, chunk in enumerate(sage._stream_completion(full_query, prompt), 1):
+                    chunks.append(chunk)
+                    # Re-render every 32 chunks to amortize Markdown parsing
+                    if i % 32 == 0:
+                        live.update(Markdown("".join(chunks), **md_options))
+                live.update(Markdown("".join(chunks), **md_options))
+        else:
+            response = sage._get_completion(full_query, prompt)
+            stripped = response.strip()
+            if (stripped.startswith("```") and stripped.endswith("```")
+                    and stripped.count("```") == 2):
+                # Single fenced block: Syntax alone skips the CommonMark parse
+                from rich.syntax import Syntax
+                first_line, _, body = stripped[3:-3].partition("\n")
+                lang = first_line.strip() or config.code_lexer
+                sage.console.print(Syntax(body.rstrip(), lang, theme=config.code_theme))
+            else:
+                sage.console.print(Markdown(response, **md_options))
 
     except Exception as e:
         logging.error(f"Error processing request: {e}")
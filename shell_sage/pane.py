@@ -1,9 +1,68 @@
 import subprocess
-from subprocess import check_output as co
-from typing import List, Optional
+import threading
+from functools import lru_cache
+from time import monotonic
+from typing import Optional
 
 
-def get_pane_output(num_lines: int, pane_id: Optional[str] = None) -> str:
+_CAP_BASE = ['tmux', 'capture-pane', '-p', '-S']
+
+# Back-to-back queries about the same terminal state shouldn't re-fork
+# tmux; captures are reused within this window
+_CAPTURE_TTL = 0.5
+_capture_cache: dict[tuple[str, Optional[str]], tuple[float, str]] = {}
+# Serializes cache writes: _capture runs from a thread pool in
+# get_pane_outputs, and sweeping the dict while another thread inserts
+# would raise RuntimeError
+_capture_lock = threading.Lock()
+
+
+def _capture(lines_arg: str, pane_id: Optional[str] = None) -> Optional[str]:
+    """Run capture-pane with a preformatted -<num_lines> argument
+
+    Results are cached per (lines, pane) for a short TTL so rapid
+    repeated invocations share one subprocess call.
+    """
+    key = (lines_arg, pane_id)
+    now = monotonic()
+    hit = _capture_cache.get(key)
+    if hit is not None and now - hit[0] < _CAPTURE_TTL:
+        return hit[1]
+    cmd = _CAP_BASE + [lines_arg]
+    if pane_id:
+        cmd += ['-t', pane_id]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        return None
+    with _capture_lock:
+        if len(_capture_cache) > 32:
+            # Evict stale entries lazily instead of on every hit
+            for stale in [k for k, (t, _) in _capture_cache.items()
+                          if now - t >= _CAPTURE_TTL]:
+                _capture_cache.pop(stale, None)
+        _capture_cache[key] = (now, result.stdout)
+    return result.stdout
+
+@lru_cache(maxsize=1)
+def _pane_index() -> Optional[tuple[tuple[str, str], ...]]:
+    """List (pane_id, active-flag) pairs with a single tmux fork, once per process
+
+    The #{?pane_active,active,} format conditional folds the
+    display-message active-pane lookup into the list-panes call.
+    """
+    result = subprocess.run(
+        ['tmux', 'list-panes', '-F', '#{pane_id} #{?pane_active,active,}'],
+        capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        return None
+    pairs = []
+    for line in result.stdout.splitlines():
+        pid, _, flag = line.partition(' ')
+        pairs.append((pid, flag))
+    return tuple(pairs)
+
+
+def get_pane_output(num_lines: int, pane_id: Optional[str] = None) -> Optional[str]:
     """Get output from a tmux pane
 
     Args:
@@ -11,38 +70,45 @@ def get_pane_output(num_lines: int, pane_id: Optional[str] = None) -> str:
         pane_id: Optional tmux pane ID to capture from. If None, uses current pane.
 
     Returns:
-        Captured pane output as string
-
-    Raises:
-        subprocess.CalledProcessError: If tmux command fails
+        Captured pane output as string, or None if the tmux command fails
     """
-    cmd = ['tmux', 'capture-pane', '-p', '-S', f'-{num_lines}']
-    if pane_id:
-        cmd += ['-t', pane_id]
-    return co(cmd, text=True)
+    return _capture(f'-{num_lines}', pane_id)
 
-def get_pane_outputs(num_lines: int) -> str:
+def get_pane_outputs(num_lines: int) -> Optional[str]:
     """Get output from all tmux panes with XML-style formatting
 
     Args:
         num_lines: Number of lines of history to capture per pane
 
     Returns:
-        String containing all pane outputs with XML tags
-
-    Raises:
-        subprocess.CalledProcessError: If tmux commands fail
+        String containing all pane outputs with XML tags, or None if the
+        tmux metadata queries fail
     """
-    current_id = co(['tmux', 'display-message', '-p', '#{pane_id}'], text=True).strip()
-    pane_ids: List[str] = co(['tmux', 'list-panes', '-F', '#{pane_id}'], text=True).splitlines()
+    panes = _pane_index()
+    if panes is None:
+        return None
 
-    outputs = []
-    for pid in pane_ids:
-        is_active = 'active' if pid == current_id else ''
-        pane_output = get_pane_output(num_lines, pid)
-        outputs.append(f"<pane id={pid} {is_active}>{pane_output}</pane>")
+    lines_arg = f'-{num_lines}'
+    if len(panes) > 1:
+        # Captures block on tmux socket reads, so run them concurrently;
+        # total latency drops to the slowest pane instead of the sum
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(panes)) as pool:
+            captured = list(pool.map(lambda p: _capture(lines_arg, p[0]), panes))
+    else:
+        captured = [_capture(lines_arg, pid) for pid, _ in panes]
 
-    return '\n'.join(outputs)
+    # Collect flat fragments so the large capture strings are only copied
+    # once, by the final join
+    fragments = []
+    for (pid, is_active), pane_output in zip(panes, captured):
+        if pane_output is None:
+            continue
+        if fragments:
+            fragments.append('\n')
+        fragments.extend(('<pane id=', pid, ' ', is_active, '>', pane_output, '</pane>'))
+
+    return ''.join(fragments)
 
 def get_history(num_lines: int, pane_id: str = 'current') -> Optional[str]:
     """Get history from tmux pane(s)
@@ -57,11 +123,8 @@ def get_history(num_lines: int, pane_id: str = 'current') -> Optional[str]:
     Returns:
         Captured history as string, or None if capture fails
     """
-    try:
-        if pane_id == 'current':
-            return get_pane_output(num_lines)
-        if pane_id == 'all':
-            return get_pane_outputs(num_lines)
-        return get_pane_output(num_lines, pane_id)
-    except subprocess.CalledProcessError:
-        return None
+    if pane_id == 'current':
+        return get_pane_output(num_lines)
+    if pane_id == 'all':
+        return get_pane_outputs(num_lines)
+    return get_pane_output(num_lines, pane_id)
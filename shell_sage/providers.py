@@ -1,14 +1,14 @@
 AVAILABLE_PROVIDERS = {
     "anthropic": {
-        "models": [
+        "models": (
             "claude-3-5-sonnet-20241022",
             "claude-3-5-haiku-20241022",
             "claude-3-opus-20240229",
-        ],
+        ),
         "default": "claude-3-5-sonnet-20241022"
     },
     "openai": {
-        "models": [
+        "models": (
             "gpt-4o",
             "gpt-4o-2024-11-20",
             "gpt-4o-2024-08-06",
@@ -16,11 +16,16 @@ AVAILABLE_PROVIDERS = {
             "gpt-4o-mini",
             "o1-preview",
             "o1-mini"
-        ],
+        ),
         "default": "gpt-4o-2024-11-20"
     }
 }
 
+# Frozen per-provider model sets for O(1) validation lookups
+PROVIDER_MODELS = {
+    provider: frozenset(info["models"])
+    for provider, info in AVAILABLE_PROVIDERS.items()
+}
 MODEL_ALIASES = {
     # Anthropic shortcuts
     "sonnet": "anthropic:claude-3-5-sonnet-20241022",